@@ -2,7 +2,26 @@ use rustpix_algorithms::{
     AbsClustering, AbsConfig, AbsState, GridClustering, GridConfig, GridState,
 };
 use rustpix_core::soa::HitBatch;
-use std::time::Instant;
+use std::time::{Duration, Instant};
+
+/// Number of timed runs per algorithm; the fastest one is compared.
+const RUNS: usize = 3;
+
+/// Best-of-`RUNS` wall time of `run` on a fresh copy of `batch`.
+///
+/// A single run is easily skewed by scheduler or frequency-scaling noise,
+/// which makes the Grid/ABS ratio below flaky.
+fn min_duration(batch: &HitBatch, mut run: impl FnMut(&mut HitBatch)) -> Duration {
+    (0..RUNS)
+        .map(|_| {
+            let mut batch = batch.clone();
+            let start = Instant::now();
+            run(&mut batch);
+            start.elapsed()
+        })
+        .min()
+        .unwrap_or_default()
+}
 
 #[test]
 fn test_grid_vs_abs_performance() {
@@ -15,10 +34,13 @@ fn test_grid_vs_abs_performance() {
     // To make it challenging for Grid (without pruning), we need temporal depth in each spatial cell.
     // Concentrate all hits in a small region (e.g. 64x64) to stress the algorithm.
 
+    // Single seeded LCG so every run sees the same data. The low bits of a
+    // power-of-two LCG cycle with a short period (bit 0 alternates), so take
+    // the high bits, as the classic `rand()` does.
     let mut rng_seed: u64 = 12345;
     let mut rand = || {
         rng_seed = (rng_seed.wrapping_mul(1_103_515_245).wrapping_add(12_345)) & 0x7fff_ffff;
-        u16::try_from(rng_seed & 0xFFFF).unwrap_or(0)
+        u16::try_from(rng_seed >> 16).unwrap_or(0)
     };
 
     for i in 0..n {
@@ -37,12 +59,10 @@ fn test_grid_vs_abs_performance() {
         ..Default::default()
     };
     let abs = AbsClustering::new(abs_config);
-    let mut abs_state = AbsState::default();
-    let mut batch_abs = batch.clone();
-
-    let start_abs = Instant::now();
-    let _ = abs.cluster(&mut batch_abs, &mut abs_state).unwrap();
-    let duration_abs = start_abs.elapsed();
+    let duration_abs = min_duration(&batch, |hits| {
+        let mut abs_state = AbsState::default();
+        let _ = abs.cluster(hits, &mut abs_state).unwrap();
+    });
     println!("ABS time: {duration_abs:?}");
 
     // Run Grid
@@ -52,12 +72,10 @@ fn test_grid_vs_abs_performance() {
         ..Default::default()
     };
     let grid = GridClustering::new(grid_config);
-    let mut grid_state = GridState::default();
-    let mut batch_grid = batch.clone();
-
-    let start_grid = Instant::now();
-    let _ = grid.cluster(&mut batch_grid, &mut grid_state).unwrap();
-    let duration_grid = start_grid.elapsed();
+    let duration_grid = min_duration(&batch, |hits| {
+        let mut grid_state = GridState::default();
+        let _ = grid.cluster(hits, &mut grid_state).unwrap();
+    });
     println!("Grid time: {duration_grid:?}");
 
     // Performance check: Grid should be within 5x of ABS
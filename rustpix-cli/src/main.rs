@@ -11,6 +11,7 @@ use rustpix_core::clustering::ClusteringConfig;
 use rustpix_core::extraction::ExtractionConfig;
 use rustpix_core::soa::HitBatch;
 use rustpix_io::{out_of_core_neutron_stream, OutOfCoreConfig, Tpx3FileReader};
+use std::io::Write;
 use std::path::PathBuf;
 use std::time::Instant;
 use thiserror::Error;
@@ -38,7 +39,7 @@ enum CliError {
 }
 
 /// Clustering algorithm selection.
-#[derive(Debug, Clone, Copy, ValueEnum)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, ValueEnum)]
 enum Algorithm {
     /// Age-Based Spatial clustering (primary, O(n) average)
     Abs,
@@ -128,6 +129,19 @@ enum Commands {
         /// Number of iterations
         #[arg(short, long, default_value = "3")]
         iterations: usize,
+
+        /// Algorithm(s) to benchmark (repeat or comma-separate; default: all)
+        #[arg(short, long, value_enum, value_delimiter = ',')]
+        algorithm: Vec<Algorithm>,
+
+        /// Only benchmark the first N hits of the file (quick checks)
+        #[arg(long)]
+        max_hits: Option<usize>,
+
+        /// Skip DBSCAN when the batch has more hits than this (it dominates run time);
+        /// ignored when DBSCAN is requested explicitly with --algorithm
+        #[arg(long, default_value = "200000")]
+        dbscan_max_hits: usize,
     },
 
     /// Benchmark out-of-core single vs multi-threaded processing
@@ -216,7 +230,13 @@ fn main() -> Result<()> {
 
         Commands::Info { input } => run_info(&input),
 
-        Commands::Benchmark { input, iterations } => run_benchmark(&input, iterations),
+        Commands::Benchmark {
+            input,
+            iterations,
+            algorithm,
+            max_hits,
+            dbscan_max_hits,
+        } => run_benchmark(&input, iterations, &algorithm, max_hits, dbscan_max_hits),
 
         Commands::OutOfCoreBenchmark {
             input,
@@ -490,9 +510,18 @@ fn run_info(input: &PathBuf) -> Result<()> {
     Ok(())
 }
 
-fn run_benchmark(input: &PathBuf, iterations: usize) -> Result<()> {
+fn run_benchmark(
+    input: &PathBuf,
+    iterations: usize,
+    selected: &[Algorithm],
+    max_hits: Option<usize>,
+    dbscan_max_hits: usize,
+) -> Result<()> {
     let reader = Tpx3FileReader::open(input)?;
-    let base_batch = reader.read_batch()?;
+    let mut base_batch = reader.read_batch()?;
+    if let Some(max_hits) = max_hits {
+        base_batch.truncate(max_hits);
+    }
 
     println!(
         "Benchmarking with {} hits, {} iterations",
@@ -506,21 +535,39 @@ fn run_benchmark(input: &PathBuf, iterations: usize) -> Result<()> {
         (Algorithm::Grid, "Grid"),
     ];
 
-    println!(
+    // Lock stdout once for the whole report. Rows are written between timed
+    // runs and flushed immediately so results show up promptly when piped.
+    let mut out = std::io::stdout().lock();
+    writeln!(
+        out,
         "{:<10} | {:<15} | {:<15} | {:<15}",
         "Algorithm", "Mean Time (ms)", "Min Time (ms)", "Max Time (ms)"
-    );
-    println!("{:-<65}", "");
+    )?;
+    writeln!(out, "{:-<65}", "")?;
+    out.flush()?;
 
     for (algo_enum, name) in algorithms {
+        if !selected.is_empty() && !selected.contains(&algo_enum) {
+            continue;
+        }
+        if algo_enum == Algorithm::Dbscan
+            && selected.is_empty()
+            && base_batch.len() > dbscan_max_hits
+        {
+            writeln!(
+                out,
+                "{name:<10} | SKIPPED ({} hits > --dbscan-max-hits {dbscan_max_hits})",
+                base_batch.len()
+            )?;
+            out.flush()?;
+            continue;
+        }
         warmup_algorithm(algo_enum, &base_batch);
         let times = benchmark_algorithm(algo_enum, &base_batch, iterations)?;
+        let TimingStats { mean, min, max } = TimingStats::from_samples(&times);
 
-        let min_time = times.iter().fold(f64::INFINITY, |a, &b| a.min(b));
-        let max_time = times.iter().fold(f64::NEG_INFINITY, |a, &b| a.max(b));
-        let mean_time = times.iter().sum::<f64>() / usize_to_f64(times.len());
-
-        println!("{name:<10} | {mean_time:<15.2} | {min_time:<15.2} | {max_time:<15.2}");
+        writeln!(out, "{name:<10} | {mean:<15.2} | {min:<15.2} | {max:<15.2}")?;
+        out.flush()?;
     }
 
     Ok(())
@@ -564,8 +611,8 @@ fn run_out_of_core_benchmark(
     multi_config = multi_config.with_parallelism(threads);
     multi_config = multi_config.with_async_io(async_io);
 
-    let mut single_total = std::time::Duration::ZERO;
-    let mut multi_total = std::time::Duration::ZERO;
+    let mut single_times = Vec::with_capacity(iterations);
+    let mut multi_times = Vec::with_capacity(iterations);
     for _ in 0..iterations {
         let (hits, neutrons, duration) = bench_out_of_core(
             input,
@@ -575,7 +622,7 @@ fn run_out_of_core_benchmark(
             &params,
             &single_config,
         )?;
-        single_total += duration;
+        single_times.push(duration.as_secs_f64());
 
         let (hits_mt, neutrons_mt, duration) = bench_out_of_core(
             input,
@@ -585,7 +632,7 @@ fn run_out_of_core_benchmark(
             &params,
             &multi_config,
         )?;
-        multi_total += duration;
+        multi_times.push(duration.as_secs_f64());
 
         if hits != hits_mt || neutrons != neutrons_mt {
             eprintln!(
@@ -594,9 +641,8 @@ fn run_out_of_core_benchmark(
         }
     }
 
-    let iterations_f64 = usize_to_f64(iterations);
-    let single_avg = single_total.as_secs_f64() / iterations_f64;
-    let multi_avg = multi_total.as_secs_f64() / iterations_f64;
+    let single_avg = TimingStats::from_samples(&single_times).mean;
+    let multi_avg = TimingStats::from_samples(&multi_times).mean;
     let speedup = single_avg / multi_avg.max(f64::EPSILON);
 
     println!("Out-of-core benchmark ({iterations} iterations)");
@@ -632,6 +678,23 @@ fn bench_out_of_core(
     Ok((total_hits, total_neutrons, start.elapsed()))
 }
 
+/// Mean/min/max of a set of benchmark timings (in the samples' unit).
+struct TimingStats {
+    mean: f64,
+    min: f64,
+    max: f64,
+}
+
+impl TimingStats {
+    fn from_samples(samples: &[f64]) -> Self {
+        Self {
+            mean: samples.iter().sum::<f64>() / usize_to_f64(samples.len()),
+            min: samples.iter().fold(f64::INFINITY, |a, &b| a.min(b)),
+            max: samples.iter().fold(f64::NEG_INFINITY, |a, &b| a.max(b)),
+        }
+    }
+}
+
 fn warmup_algorithm(algo_enum: Algorithm, base_batch: &HitBatch) {
     let mut batch = base_batch.clone();
     let _ = run_cluster_once(algo_enum, &mut batch);
@@ -643,10 +706,14 @@ fn benchmark_algorithm(
     iterations: usize,
 ) -> Result<Vec<f64>> {
     let mut times = Vec::with_capacity(iterations);
+    let mut batch = HitBatch::with_capacity(base_batch.len());
 
     for _ in 0..iterations {
+        // Clustering mutates the batch; restore it before starting the clock.
+        // clear + append reuses the scratch buffers instead of reallocating.
+        batch.clear();
+        batch.append(base_batch);
         let start = Instant::now();
-        let mut batch = base_batch.clone();
         run_cluster_once(algo_enum, &mut batch)?;
         times.push(start.elapsed().as_secs_f64() * 1000.0);
     }
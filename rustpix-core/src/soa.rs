@@ -68,6 +68,17 @@ impl HitBatch {
         self.cluster_id.clear();
     }
 
+    /// Shortens the batch to the first `len` hits (no-op if already shorter).
+    pub fn truncate(&mut self, len: usize) {
+        self.x.truncate(len);
+        self.y.truncate(len);
+        self.tof.truncate(len);
+        self.tot.truncate(len);
+        self.timestamp.truncate(len);
+        self.chip_id.truncate(len);
+        self.cluster_id.truncate(len);
+    }
+
     /// Appends all hits from another batch to this one.
     pub fn append(&mut self, other: &HitBatch) {
         self.x.extend_from_slice(&other.x);
@@ -91,12 +102,40 @@ impl HitBatch {
         self.cluster_id.push(-1); // Default unclustered
     }
 
+    /// Returns the first column whose length differs from `x`, with its length.
+    ///
+    /// Batches built with [`push`](Self::push) are always consistent; this is
+    /// for batches assembled from externally supplied columns.
+    #[must_use]
+    pub fn mismatched_column(&self) -> Option<(&'static str, usize)> {
+        let len = self.len();
+        [
+            ("y", self.y.len()),
+            ("tof", self.tof.len()),
+            ("tot", self.tot.len()),
+            ("timestamp", self.timestamp.len()),
+            ("chip_id", self.chip_id.len()),
+            ("cluster_id", self.cluster_id.len()),
+        ]
+        .into_iter()
+        .find(|&(_, other)| other != len)
+    }
+
+    /// Returns true if hits are in non-decreasing TOF order.
+    #[must_use]
+    pub fn is_time_ordered(&self) -> bool {
+        self.tof.windows(2).all(|pair| pair[0] <= pair[1])
+    }
+
     /// Sorts all hits by TOF, keeping columns aligned.
+    ///
+    /// Batches that are already time-ordered (the common case for merged
+    /// sections) are detected with a linear scan and left untouched.
     pub fn sort_by_tof(&mut self) {
-        let len = self.len();
-        if len <= 1 {
+        if self.is_time_ordered() {
             return;
         }
+        let len = self.len();
 
         let mut indices: Vec<usize> = (0..len).collect();
         indices.sort_unstable_by_key(|&i| self.tof[i]);
@@ -146,8 +185,56 @@ mod tests {
         batch.push((11, 21, 1001, 6, 123_457, 0));
         assert_eq!(batch.len(), 2);
 
+        batch.truncate(1);
+        assert_eq!(batch.len(), 1);
+        assert_eq!(batch.cluster_id.len(), 1);
+        batch.truncate(5);
+        assert_eq!(batch.len(), 1);
+
         batch.clear();
         assert!(batch.is_empty());
         assert_eq!(batch.len(), 0);
     }
+
+    #[test]
+    fn test_mismatched_column() {
+        let mut batch = HitBatch::with_capacity(2);
+        batch.push((1, 1, 100, 1, 0, 0));
+        batch.push((2, 2, 200, 2, 0, 0));
+        assert_eq!(batch.mismatched_column(), None);
+
+        batch.tof.pop();
+        assert_eq!(batch.mismatched_column(), Some(("tof", 1)));
+
+        let batch = HitBatch {
+            x: vec![1, 2],
+            y: vec![1, 2],
+            tof: vec![100, 200],
+            tot: vec![1, 2],
+            timestamp: vec![0, 0],
+            chip_id: vec![0, 0, 0],
+            cluster_id: vec![-1, -1],
+        };
+        assert_eq!(batch.mismatched_column(), Some(("chip_id", 3)));
+    }
+
+    #[test]
+    fn test_sort_by_tof() {
+        let mut batch = HitBatch::with_capacity(3);
+        batch.push((1, 1, 300, 1, 0, 0));
+        batch.push((2, 2, 100, 2, 0, 1));
+        batch.push((3, 3, 200, 3, 0, 2));
+
+        assert!(!batch.is_time_ordered());
+        batch.sort_by_tof();
+        assert!(batch.is_time_ordered());
+        assert_eq!(batch.tof, vec![100, 200, 300]);
+        assert_eq!(batch.x, vec![2, 3, 1]);
+        assert_eq!(batch.chip_id, vec![1, 2, 0]);
+
+        // Already sorted input is left unchanged.
+        let expected = batch.clone();
+        batch.sort_by_tof();
+        assert_eq!(batch, expected);
+    }
 }
@@ -1,6 +1,6 @@
 //! Thin Python bindings for rustpix.
 
-use numpy::PyArray1;
+use numpy::{Element, PyArray1, PyArrayMethods, PyReadonlyArray1, PyUntypedArrayMethods};
 use pyo3::exceptions::{PyImportError, PyNotImplementedError, PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
@@ -428,6 +428,7 @@ impl PyNeutronBatchStream {
 #[pyo3(signature = (path, detector_config=None, output_path=None))]
 /// Read TPX3 hits as a single batch (always time-ordered).
 fn read_tpx3_hits(
+    py: Python<'_>,
     path: &str,
     detector_config: Option<PyRef<'_, PyDetectorConfig>>,
     output_path: Option<&str>,
@@ -442,8 +443,8 @@ fn read_tpx3_hits(
         .map_err(|err| PyRuntimeError::new_err(err.to_string()))?
         .with_config(config.clone());
 
-    let batch = reader
-        .read_batch()
+    let batch = py
+        .allow_threads(|| reader.read_batch())
         .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
 
     Ok(PyHitBatch {
@@ -521,19 +522,23 @@ fn process_tpx3_neutrons(
     }
 
     if collect {
-        let neutrons = if processing.time_ordered {
-            let stream = reader
-                .stream_time_ordered()
-                .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
-            cluster_and_extract_stream(stream, algo, &clustering, &extraction, &params)
-                .map_err(|err| PyRuntimeError::new_err(err.to_string()))?
-        } else {
-            let mut batch = reader
-                .read_batch()
-                .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
-            cluster_and_extract_batch(&mut batch, algo, &clustering, &extraction, &params)
-                .map_err(|err| PyRuntimeError::new_err(err.to_string()))?
-        };
+        // Reading and clustering never touch Python objects; run them without the GIL.
+        let time_ordered = processing.time_ordered;
+        let neutrons = py
+            .allow_threads(|| -> std::result::Result<NeutronBatch, String> {
+                if time_ordered {
+                    let stream = reader
+                        .stream_time_ordered()
+                        .map_err(|err| err.to_string())?;
+                    cluster_and_extract_stream(stream, algo, &clustering, &extraction, &params)
+                        .map_err(|err| err.to_string())
+                } else {
+                    let mut batch = reader.read_batch().map_err(|err| err.to_string())?;
+                    cluster_and_extract_batch(&mut batch, algo, &clustering, &extraction, &params)
+                        .map_err(|err| err.to_string())
+                }
+            })
+            .map_err(PyRuntimeError::new_err)?;
 
         let batch = PyNeutronBatch {
             batch: Some(neutrons),
@@ -575,6 +580,7 @@ fn process_tpx3_neutrons(
 #[pyfunction]
 #[pyo3(signature = (batch, clustering_config=None, extraction_config=None, **kwargs))]
 fn cluster_hits(
+    py: Python<'_>,
     mut batch: PyRefMut<'_, PyHitBatch>,
     clustering_config: Option<PyRef<'_, PyClusteringConfig>>,
     extraction_config: Option<PyRef<'_, PyExtractionConfig>>,
@@ -601,7 +607,12 @@ fn cluster_hits(
         .as_mut()
         .ok_or_else(|| PyValueError::new_err("HitBatch data has already been moved"))?;
 
-    let neutrons = cluster_and_extract_batch(batch_ref, algo, &clustering, &extraction, &params)
+    // Clustering only touches Rust-owned buffers; release the GIL so other
+    // Python threads (e.g. concurrent cluster_hits calls) can run meanwhile.
+    let neutrons = py
+        .allow_threads(|| {
+            cluster_and_extract_batch(batch_ref, algo, &clustering, &extraction, &params)
+        })
         .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
 
     Ok(PyNeutronBatch {
@@ -617,6 +628,97 @@ fn cluster_hits(
     })
 }
 
+/// Cluster hits given as NumPy arrays (SoA) and extract neutrons.
+///
+/// Equivalent to `cluster_hits(hits_from_numpy(x, y, tof, tot, timestamp, chip_id), ...)`
+/// without creating an intermediate `HitBatch` object. `timestamp` and `chip_id` are
+/// keyword-only so the configs line up with `cluster_hits`. Accepts the same kwargs as
+/// `cluster_hits` (`algorithm`, `abs_scan_interval`, `dbscan_min_points`, `grid_cell_size`).
+#[pyfunction]
+#[pyo3(signature = (x, y, tof, tot, clustering_config=None, extraction_config=None, *, timestamp=None, chip_id=None, **kwargs))]
+#[allow(clippy::too_many_arguments)]
+fn cluster_hits_arrays(
+    py: Python<'_>,
+    x: PyReadonlyArray1<'_, u16>,
+    y: PyReadonlyArray1<'_, u16>,
+    tof: PyReadonlyArray1<'_, u32>,
+    tot: PyReadonlyArray1<'_, u16>,
+    clustering_config: Option<PyRef<'_, PyClusteringConfig>>,
+    extraction_config: Option<PyRef<'_, PyExtractionConfig>>,
+    timestamp: Option<PyReadonlyArray1<'_, u32>>,
+    chip_id: Option<PyReadonlyArray1<'_, u8>>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<PyNeutronBatch> {
+    let selection = parse_algorithm_kwargs(kwargs)?;
+    let output_path = parse_output_path(kwargs)?;
+    ensure_hdf5_disabled(output_path.as_deref())?;
+
+    let clustering = clustering_config
+        .as_ref()
+        .map(|cfg| cfg.inner.clone())
+        .unwrap_or_default();
+    let extraction = extraction_config
+        .as_ref()
+        .map(|cfg| cfg.inner.clone())
+        .unwrap_or_default();
+
+    let params = selection.params;
+    let algo = selection.algorithm;
+
+    let mut batch = hit_batch_from_numpy(&x, &y, &tof, &tot, timestamp.as_ref(), chip_id.as_ref())?;
+
+    let neutrons = py
+        .allow_threads(|| {
+            cluster_and_extract_batch(&mut batch, algo, &clustering, &extraction, &params)
+        })
+        .map_err(|err| PyRuntimeError::new_err(err.to_string()))?;
+
+    Ok(PyNeutronBatch {
+        batch: Some(neutrons),
+        metadata: BatchMetadata {
+            detector: DetectorConfig::default(),
+            clustering: Some(clustering),
+            extraction: Some(extraction),
+            algorithm: Some(selection.name),
+            source_path: None,
+            time_ordered: true,
+        },
+    })
+}
+
+/// Build a `HitBatch` from NumPy arrays without going through Python objects.
+///
+/// `x`, `y`, `tot` must be `uint16`, `tof` `uint32`. Optional `timestamp` (`uint32`)
+/// and `chip_id` (`uint8`) default to zeros. All arrays must have the same length.
+/// Strided views are accepted, so the fields of an aligned structured array can be
+/// passed directly (`hits_from_numpy(a["x"], a["y"], a["tof"], a["tot"])`); fields of
+/// a packed (unaligned) dtype raise `ValueError`. Hits are sorted by TOF, as the
+/// clustering algorithms require.
+#[pyfunction]
+#[pyo3(signature = (x, y, tof, tot, timestamp=None, chip_id=None))]
+fn hits_from_numpy(
+    x: PyReadonlyArray1<'_, u16>,
+    y: PyReadonlyArray1<'_, u16>,
+    tof: PyReadonlyArray1<'_, u32>,
+    tot: PyReadonlyArray1<'_, u16>,
+    timestamp: Option<PyReadonlyArray1<'_, u32>>,
+    chip_id: Option<PyReadonlyArray1<'_, u8>>,
+) -> PyResult<PyHitBatch> {
+    let batch = hit_batch_from_numpy(&x, &y, &tof, &tot, timestamp.as_ref(), chip_id.as_ref())?;
+
+    Ok(PyHitBatch {
+        batch: Some(batch),
+        metadata: BatchMetadata {
+            detector: DetectorConfig::default(),
+            clustering: None,
+            extraction: None,
+            algorithm: None,
+            source_path: None,
+            time_ordered: true,
+        },
+    })
+}
+
 #[pyfunction]
 #[pyo3(signature = (path, detector_config=None, clustering_config=None, extraction_config=None, **kwargs))]
 /// Stream TPX3 neutrons in pulse-bounded batches.
@@ -727,6 +829,8 @@ fn rustpix(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(read_tpx3_hits, m)?)?;
     m.add_function(wrap_pyfunction!(process_tpx3_neutrons, m)?)?;
     m.add_function(wrap_pyfunction!(cluster_hits, m)?)?;
+    m.add_function(wrap_pyfunction!(cluster_hits_arrays, m)?)?;
+    m.add_function(wrap_pyfunction!(hits_from_numpy, m)?)?;
     m.add_function(wrap_pyfunction!(stream_tpx3_neutrons, m)?)?;
     m.add_function(wrap_pyfunction!(stream_tpx3_hits, m)?)?;
     Ok(())
@@ -741,6 +845,70 @@ fn ensure_hdf5_disabled(output_path: Option<&str>) -> PyResult<()> {
     Ok(())
 }
 
+/// Copy a 1-D NumPy array into a `Vec`.
+///
+/// Contiguous arrays are copied with a single memcpy; strided views (e.g. a field of a
+/// structured array such as `hits["x"]`) are gathered element by element. Views that
+/// are not aligned for `T` (fields of a packed structured dtype) are rejected.
+fn numpy_to_vec<T: Element + Copy>(
+    name: &str,
+    array: &PyReadonlyArray1<'_, T>,
+) -> PyResult<Vec<T>> {
+    let stride = array.strides()[0].unsigned_abs();
+    if !array.data().is_aligned() || !stride.is_multiple_of(std::mem::align_of::<T>()) {
+        return Err(PyValueError::new_err(format!(
+            "'{name}' is not aligned for its dtype; use an aligned structured dtype \
+             (align=True) or pass a contiguous copy"
+        )));
+    }
+    Ok(match array.as_slice() {
+        Ok(slice) => slice.to_vec(),
+        Err(_) => array.as_array().iter().copied().collect(),
+    })
+}
+
+fn hit_batch_from_numpy(
+    x: &PyReadonlyArray1<'_, u16>,
+    y: &PyReadonlyArray1<'_, u16>,
+    tof: &PyReadonlyArray1<'_, u32>,
+    tot: &PyReadonlyArray1<'_, u16>,
+    timestamp: Option<&PyReadonlyArray1<'_, u32>>,
+    chip_id: Option<&PyReadonlyArray1<'_, u8>>,
+) -> PyResult<HitBatch> {
+    let x = numpy_to_vec("x", x)?;
+    let len = x.len();
+    let y = numpy_to_vec("y", y)?;
+    let tof = numpy_to_vec("tof", tof)?;
+    let tot = numpy_to_vec("tot", tot)?;
+    let timestamp = timestamp
+        .map(|array| numpy_to_vec("timestamp", array))
+        .transpose()?
+        .unwrap_or_else(|| vec![0; len]);
+    let chip_id = chip_id
+        .map(|array| numpy_to_vec("chip_id", array))
+        .transpose()?
+        .unwrap_or_else(|| vec![0; len]);
+
+    let mut batch = HitBatch {
+        x,
+        y,
+        tof,
+        tot,
+        timestamp,
+        chip_id,
+        cluster_id: vec![-1; len],
+    };
+    if let Some((name, other)) = batch.mismatched_column() {
+        return Err(PyValueError::new_err(format!(
+            "Array length mismatch: '{name}' has {other} elements, expected {len}"
+        )));
+    }
+    // Clustering links hits within a TOF window and assumes TOF order; caller data may
+    // not be sorted. Already-sorted input costs a single linear scan.
+    batch.sort_by_tof();
+    Ok(batch)
+}
+
 struct AlgorithmSelection {
     name: String,
     algorithm: ClusteringAlgorithm,
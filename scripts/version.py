@@ -15,9 +15,11 @@ Usage:
     python scripts/version.py major    # Bump major: 0.1.0 -> 1.0.0
 """
 
+import functools
 import re
 import subprocess
 import sys
+import tomllib
 from pathlib import Path
 
 # Repository root (parent of scripts/)
@@ -29,80 +31,116 @@ CARGO_WORKSPACE = REPO_ROOT / "Cargo.toml"
 # Files to sync
 PYPROJECT = REPO_ROOT / "pyproject.toml"
 
-# All crate Cargo.toml files (for verification)
-CRATE_CARGO_FILES = [
-    REPO_ROOT / "rustpix-core" / "Cargo.toml",
-    REPO_ROOT / "rustpix-tpx" / "Cargo.toml",
-    REPO_ROOT / "rustpix-algorithms" / "Cargo.toml",
-    REPO_ROOT / "rustpix-io" / "Cargo.toml",
-    REPO_ROOT / "rustpix-python" / "Cargo.toml",
-    REPO_ROOT / "rustpix-cli" / "Cargo.toml",
-    REPO_ROOT / "rustpix-gui" / "Cargo.toml",
-    REPO_ROOT / "tools" / "Cargo.toml",
+# All crate Cargo.toml files (for verification), paired with their repo-relative display path
+CRATE_CARGO_FILES: list[tuple[Path, str]] = [
+    (REPO_ROOT / "rustpix-core" / "Cargo.toml", "rustpix-core/Cargo.toml"),
+    (REPO_ROOT / "rustpix-tpx" / "Cargo.toml", "rustpix-tpx/Cargo.toml"),
+    (REPO_ROOT / "rustpix-algorithms" / "Cargo.toml", "rustpix-algorithms/Cargo.toml"),
+    (REPO_ROOT / "rustpix-io" / "Cargo.toml", "rustpix-io/Cargo.toml"),
+    (REPO_ROOT / "rustpix-python" / "Cargo.toml", "rustpix-python/Cargo.toml"),
+    (REPO_ROOT / "rustpix-cli" / "Cargo.toml", "rustpix-cli/Cargo.toml"),
+    (REPO_ROOT / "rustpix-gui" / "Cargo.toml", "rustpix-gui/Cargo.toml"),
+    (REPO_ROOT / "tools" / "Cargo.toml", "tools/Cargo.toml"),
 ]
 
+# Internal crates whose [workspace.dependencies] version is bumped (for crates.io)
+INTERNAL_CRATES = ["rustpix-core", "rustpix-tpx", "rustpix-algorithms", "rustpix-io"]
+
+# Version-bump patterns, compiled once; group 1 is everything before the quoted version
+_WORKSPACE_VERSION_RE = re.compile(r'(\[workspace\.package\]\s*\n\s*version\s*=\s*)"[^"]+"')
+_INTERNAL_CRATES_RE = re.compile(
+    rf'((?:{"|".join(map(re.escape, INTERNAL_CRATES))})\s*=\s*\{{\s*version\s*=\s*)"[^"]+"'
+)
+_PYPROJECT_VERSION_RE = re.compile(r'^(version\s*=\s*)"[^"]+"', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path: Path) -> str:
+    """Read a file, caching its contents for the rest of the run."""
+    return path.read_text()
+
+
+def _write(path: Path, content: str) -> None:
+    """Write a file and drop cached contents so later reads see the change."""
+    path.write_text(content)
+    _read.cache_clear()
+
 
 def read_workspace_version() -> str:
     """Read version from workspace Cargo.toml."""
-    content = CARGO_WORKSPACE.read_text()
-    match = re.search(r'\[workspace\.package\]\s*\n\s*version\s*=\s*"([^"]+)"', content)
-    if not match:
-        raise ValueError(f"Could not find [workspace.package] version in {CARGO_WORKSPACE}")
-    return match.group(1)
+    data = tomllib.loads(_read(CARGO_WORKSPACE))
+    try:
+        return data["workspace"]["package"]["version"]
+    except KeyError:
+        raise ValueError(
+            f"Could not find [workspace.package] version in {CARGO_WORKSPACE}"
+        ) from None
 
 
 def read_pyproject_version() -> str:
     """Read version from pyproject.toml."""
-    content = PYPROJECT.read_text()
-    match = re.search(r'^version\s*=\s*"([^"]+)"', content, re.MULTILINE)
-    if not match:
-        raise ValueError(f"Could not find version in {PYPROJECT}")
-    return match.group(1)
+    data = tomllib.loads(_read(PYPROJECT))
+    try:
+        return data["project"]["version"]
+    except KeyError:
+        raise ValueError(f"Could not find [project] version in {PYPROJECT}") from None
+
 
+def _substitute(
+    pattern: re.Pattern[str], content: str, version: str, what: str, path: Path, expected: int = 1
+) -> str:
+    """Replace the quoted versions matched by ``pattern``, failing if too few matched."""
+    new_content, count = pattern.subn(rf'\g<1>"{version}"', content)
+    if count < expected:
+        raise ValueError(f"Could not find {what} to update in {path} ({count}/{expected} found)")
+    return new_content
 
-def write_workspace_version(version: str) -> None:
-    """Write version to workspace Cargo.toml (both package and dependencies)."""
-    content = CARGO_WORKSPACE.read_text()
+
+def _bumped_workspace(version: str) -> str:
+    """Return workspace Cargo.toml contents with ``version`` applied."""
+    content = _read(CARGO_WORKSPACE)
 
     # Update [workspace.package].version
-    new_content = re.sub(
-        r'(\[workspace\.package\]\s*\n\s*version\s*=\s*)"[^"]+"',
-        f'\\1"{version}"',
-        content,
+    new_content = _substitute(
+        _WORKSPACE_VERSION_RE, content, version, "[workspace.package] version", CARGO_WORKSPACE
     )
 
     # Update workspace.dependencies versions for internal crates (for crates.io)
-    internal_crates = ["rustpix-core", "rustpix-tpx", "rustpix-algorithms", "rustpix-io"]
-    for crate in internal_crates:
-        new_content = re.sub(
-            rf'({crate}\s*=\s*\{{\s*version\s*=\s*)"[^"]+"',
-            f'\\1"{version}"',
-            new_content,
-        )
-
-    CARGO_WORKSPACE.write_text(new_content)
-    print(f"  Updated {CARGO_WORKSPACE.relative_to(REPO_ROOT)}")
+    return _substitute(
+        _INTERNAL_CRATES_RE,
+        new_content,
+        version,
+        "internal crate versions in [workspace.dependencies]",
+        CARGO_WORKSPACE,
+        expected=len(INTERNAL_CRATES),
+    )
 
 
-def sync_pyproject(version: str) -> None:
-    """Sync version to pyproject.toml."""
-    content = PYPROJECT.read_text()
-    new_content = re.sub(
-        r'^(version\s*=\s*)"[^"]+"',
-        f'\\1"{version}"',
-        content,
-        flags=re.MULTILINE,
+def _bumped_pyproject(version: str) -> str:
+    """Return pyproject.toml contents with ``version`` applied."""
+    return _substitute(
+        _PYPROJECT_VERSION_RE, _read(PYPROJECT), version, "[project] version", PYPROJECT
     )
-    PYPROJECT.write_text(new_content)
-    print(f"  Updated {PYPROJECT.relative_to(REPO_ROOT)}")
+
+
+def write_workspace_version(content: str) -> None:
+    """Write updated contents (from ``_bumped_workspace``) to workspace Cargo.toml."""
+    _write(CARGO_WORKSPACE, content)
+    print(f"  Updated {CARGO_WORKSPACE.name}")
+
+
+def sync_pyproject(content: str) -> None:
+    """Write updated contents (from ``_bumped_pyproject``) to pyproject.toml."""
+    _write(PYPROJECT, content)
+    print(f"  Updated {PYPROJECT.name}")
 
 
 def check_crate_uses_workspace_version(cargo_path: Path) -> bool:
     """Check if a crate Cargo.toml uses workspace version inheritance."""
-    content = cargo_path.read_text()
-    # Look for version.workspace = true or version = { workspace = true }
-    return bool(re.search(r'version\.workspace\s*=\s*true', content) or
-                re.search(r'version\s*=\s*\{\s*workspace\s*=\s*true', content))
+    data = tomllib.loads(_read(cargo_path))
+    # Both `version.workspace = true` and `version = { workspace = true }` parse to a table
+    version = data.get("package", {}).get("version")
+    return isinstance(version, dict) and version.get("workspace") is True
 
 
 def bump_version(version: str, component: str) -> str:
@@ -154,25 +192,27 @@ def cmd_check() -> int:
     # Check all crate Cargo.toml files use workspace inheritance
     print()
     print("Checking workspace version inheritance...")
-    for cargo_path in CRATE_CARGO_FILES:
+    for cargo_path, display in CRATE_CARGO_FILES:
         if not cargo_path.exists():
-            print(f"  ? {cargo_path.relative_to(REPO_ROOT)}: file not found")
+            print(f"  ? {display}: file not found")
             continue
 
         if check_crate_uses_workspace_version(cargo_path):
-            print(f"  ✓ {cargo_path.relative_to(REPO_ROOT)}")
+            print(f"  ✓ {display}")
         else:
-            print(f"  ✗ {cargo_path.relative_to(REPO_ROOT)}: not using version.workspace = true")
-            issues.append(f"{cargo_path.name} not using workspace version")
+            print(f"  ✗ {display}: not using version.workspace = true")
+            issues.append(f"{display} not using workspace version")
 
     # Verify Cargo workspace resolves correctly
     print()
     print("Verifying Cargo workspace...")
     try:
-        result = subprocess.run(
+        # Only the exit status and stderr matter; discard the (large) JSON on stdout
+        subprocess.run(
             ["cargo", "metadata", "--format-version=1", "--no-deps"],
             cwd=REPO_ROOT,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True,
         )
@@ -197,7 +237,7 @@ def cmd_sync() -> None:
     """Sync version from Cargo.toml to pyproject.toml."""
     version = read_workspace_version()
     print(f"Syncing version {version} to pyproject.toml...")
-    sync_pyproject(version)
+    sync_pyproject(_bumped_pyproject(version))
     print("Done!")
 
 
@@ -206,17 +246,21 @@ def cmd_bump(component: str) -> None:
     old_version = read_workspace_version()
     new_version = bump_version(old_version, component)
 
+    # Compute both files up front so nothing is written if a version line is missing
+    workspace_content = _bumped_workspace(new_version)
+    pyproject_content = _bumped_pyproject(new_version)
+
     print(f"Bumping {component} version: {old_version} -> {new_version}")
     print()
 
     # Update Cargo.toml first (single source of truth)
     print("Updating Cargo workspace...")
-    write_workspace_version(new_version)
+    write_workspace_version(workspace_content)
 
     # Sync to pyproject.toml
     print()
     print("Syncing to Python...")
-    sync_pyproject(new_version)
+    sync_pyproject(pyproject_content)
 
     print()
     print(f"✓ Version bumped to {new_version}")
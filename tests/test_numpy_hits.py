@@ -0,0 +1,101 @@
+"""Tests for building and clustering hits from NumPy arrays."""
+
+import numpy as np
+import pytest
+
+import rustpix
+
+FIELDS = [("x", "u2"), ("y", "u2"), ("tof", "u4"), ("tot", "u2")]
+
+
+def make_arrays():
+    """Two spatially separated clusters, three hits each, sorted by TOF."""
+    x = np.array([10, 11, 10, 100, 101, 100], dtype=np.uint16)
+    y = np.array([10, 10, 11, 100, 100, 101], dtype=np.uint16)
+    tof = np.array([1000, 1000, 1001, 1001, 1002, 1002], dtype=np.uint32)
+    tot = np.array([20, 30, 25, 20, 30, 25], dtype=np.uint16)
+    return x, y, tof, tot
+
+
+def structured(dtype):
+    x, y, tof, tot = make_arrays()
+    a = np.zeros(len(x), dtype=dtype)
+    a["x"], a["y"], a["tof"], a["tot"] = x, y, tof, tot
+    return a
+
+
+def test_hits_from_numpy_contiguous():
+    x, y, tof, tot = make_arrays()
+    hits = rustpix.hits_from_numpy(x, y, tof, tot)
+
+    assert hits.len() == len(x)
+    assert hits.metadata()["time_ordered"]
+    data = hits.to_numpy()
+    np.testing.assert_array_equal(data["x"], x)
+    np.testing.assert_array_equal(data["tof"], tof)
+    np.testing.assert_array_equal(data["timestamp"], np.zeros(len(x), dtype=np.uint32))
+    np.testing.assert_array_equal(data["chip_id"], np.zeros(len(x), dtype=np.uint8))
+
+
+def test_hits_from_numpy_aligned_structured_fields():
+    a = structured(np.dtype(FIELDS, align=True))
+    hits = rustpix.hits_from_numpy(a["x"], a["y"], a["tof"], a["tot"])
+
+    data = hits.to_numpy()
+    for name in ("x", "y", "tof", "tot"):
+        np.testing.assert_array_equal(data[name], a[name])
+
+
+def test_hits_from_numpy_rejects_packed_structured_fields():
+    a = structured(np.dtype(FIELDS))
+    assert not a["tof"].flags.aligned
+
+    with pytest.raises(ValueError, match="'tof' is not aligned"):
+        rustpix.hits_from_numpy(a["x"], a["y"], a["tof"], a["tot"])
+
+
+def test_hits_from_numpy_length_mismatch():
+    x, y, tof, tot = make_arrays()
+
+    with pytest.raises(ValueError, match="'tot' has 5 elements, expected 6"):
+        rustpix.hits_from_numpy(x, y, tof, tot[:-1])
+    with pytest.raises(ValueError, match="Array length mismatch"):
+        rustpix.cluster_hits_arrays(x, y, tof, tot, chip_id=np.zeros(2, dtype=np.uint8))
+
+
+def test_hits_from_numpy_sorts_by_tof():
+    x, y, tof, tot = make_arrays()
+    order = np.array([5, 0, 3, 1, 4, 2])
+    hits = rustpix.hits_from_numpy(x[order], y[order], tof[order], tot[order])
+
+    np.testing.assert_array_equal(hits.to_numpy()["tof"], np.sort(tof))
+
+
+@pytest.mark.parametrize("algorithm", ["abs", "dbscan", "grid"])
+def test_cluster_hits_arrays_matches_cluster_hits(algorithm):
+    x, y, tof, tot = make_arrays()
+    config = rustpix.ClusteringConfig(radius=5.0)
+
+    direct = rustpix.cluster_hits_arrays(x, y, tof, tot, config, algorithm=algorithm)
+    via_batch = rustpix.cluster_hits(
+        rustpix.hits_from_numpy(x, y, tof, tot), config, algorithm=algorithm
+    )
+
+    assert direct.len() == via_batch.len() == 2
+    expected = via_batch.to_numpy()
+    for name, values in direct.to_numpy().items():
+        np.testing.assert_array_equal(values, expected[name])
+
+
+def test_cluster_hits_arrays_unsorted_input():
+    # Hits A (TOF 100) and C (TOF 102) belong together; B (TOF 200) sits between them
+    # in the input and would stop the grid's temporal search if left unsorted.
+    x = np.array([10, 10, 10], dtype=np.uint16)
+    y = np.array([10, 10, 10], dtype=np.uint16)
+    tof = np.array([100, 200, 102], dtype=np.uint32)
+    tot = np.array([20, 20, 20], dtype=np.uint16)
+    config = rustpix.ClusteringConfig(temporal_window_ns=50.0)
+
+    neutrons = rustpix.cluster_hits_arrays(x, y, tof, tot, config, algorithm="grid")
+
+    assert neutrons.len() == 2